@@ -13,8 +13,12 @@
 #
 # -----------------------------------------------------------------------------
 
-# Importa a classe de configuração base
-from jupyter_server_config import ServerApp # Para Jupyter Server >= 2.0
+# Nenhum import é necessário neste arquivo: o carregador do traitlets injeta o
+# objeto `c` e resolve `c.ServerApp.*`, `c.MappingKernelManager.*` etc. por
+# string. Importar `ServerApp` aqui só anteciparia o custo transitivo de
+# `jupyter_server.serverapp` para a fase de leitura da configuração, que roda a
+# cada lançamento do servidor — um arquivo de configuração não deve importar
+# nada que não usa. (Verificável com `python -X importtime`.)
 # Ou para Jupyter Notebook clássico ou Jupyter Server < 2.0:
 # from notebook.auth import passwd # Para gerar hash de senha
 
@@ -84,6 +88,21 @@ c.ServerApp.open_browser = False
 
 # === Configurações de Diretório e Arquivos ===
 
+# c.ServerApp.contents_manager_class = '...'
+# [PT-BR] Classe que gerencia o conteúdo (notebooks, arquivos, checkpoints).
+# O padrão síncrono executa cada save/listagem/checkpoint NO event loop do
+# Tornado: com `notebook_dir` em um mount lento (bind mount, FUSE/HDFS), um
+# único save grande congela o servidor para todos os usuários conectados.
+# A variante assíncrona despacha o IO de arquivo para um pool de threads
+# (`run_in_executor`), mantendo WebSockets e demais requisições responsivos.
+# `AsyncLargeFileManager` também suporta upload em pedaços de arquivos grandes.
+c.ServerApp.contents_manager_class = 'jupyter_server.services.contents.largefilemanager.AsyncLargeFileManager'
+
+# c.ServerApp.max_buffer_size = 536870912 (padrão, 512 MB)
+# [PT-BR] Tamanho máximo do buffer para requisições/uploads. Elevado para 1 GB
+# para acomodar uploads de datasets maiores via navegador de arquivos do Lab.
+c.ServerApp.max_buffer_size = 1073741824
+
 # c.ServerApp.notebook_dir = ''
 # [PT-BR] O diretório que o Jupyter Notebook/Lab usará como raiz para seus arquivos.
 # Se vazio, usa o diretório onde o comando `jupyter notebook` ou `jupyter lab` foi executado.
@@ -91,7 +110,32 @@ c.ServerApp.open_browser = False
 # Exemplo: '/home/myuser/notebooks' ou '/srv/jupyterhub/notebooks'
 # Seu overrides.json configura `navigateToCurrentDirectory` para o filebrowser do Lab,
 # mas esta configuração define o diretório raiz inicial do servidor.
-# c.ServerApp.notebook_dir = '/home/myuser/myfiles' # Exemplo baseado no seu `spark-defaults.conf` para JupyterLab
+# Fixado explicitamente: sem isso o servidor herda o cwd de quem o lançou — se for
+# `/` ou um mount grande dentro do contêiner, a primeira listagem do navegador de
+# arquivos vira uma tempestade de stat(). O caminho abaixo é o bind mount
+# `./myfiles` definido no docker-compose.
+c.ServerApp.notebook_dir = '/home/myuser/myfiles'
+
+# c.ContentsManager.allow_hidden = False
+# [PT-BR] Mantém arquivos ocultos (dotfiles) fora das listagens servidas ao Lab.
+# Já é o padrão; explicitado aqui porque cada entrada a menos é um stat() a menos
+# por listagem de diretório.
+c.ContentsManager.allow_hidden = False
+
+# c.FileContentsManager.hide_globs = [...]
+# [PT-BR] Padrões excluídos de TODA listagem de diretório. Além dos padrões usuais,
+# oculta os artefatos que o Spark gera ao lado dos notebooks — `spark-warehouse`,
+# o metastore Derby e seu `derby.log` — que podem conter milhares de arquivos de
+# partição e tornariam cada refresh do navegador de arquivos desnecessariamente caro.
+c.FileContentsManager.hide_globs = [
+    '__pycache__',
+    '*.pyc', '*.pyo',
+    '.ipynb_checkpoints',
+    '.git',
+    'spark-warehouse',
+    'metastore_db',
+    'derby.log',
+]
 
 # c.ServerApp.allow_root = False
 # [PT-BR] Se `True`, permite que o servidor Jupyter seja executado como root.
@@ -131,23 +175,86 @@ c.ServerApp.terminals_enabled = True
 # --- Configurações de Kernel ---
 
 # c.ServerApp.kernel_manager_class = 'jupyter_server.kernel_manager.AsyncKernelManager'
-# [PT-BR] Classe para gerenciar kernels. O padrão é geralmente adequado.
+# [PT-BR] Classe para gerenciar kernels. O padrão inicia cada kernel sob demanda,
+# o que no fluxo PySpark deste repositório significa pagar `import pyspark` +
+# construção da SparkSession + subida do gateway JVM/Py4J na primeira célula
+# (latência de vários segundos). O `hotpot_km` (instalado via requirements.txt)
+# mantém um "pool" de kernels já aquecidos: quando o usuário abre um notebook,
+# um kernel com os módulos pesados pré-importados é entregue imediatamente e o
+# pool é reabastecido em segundo plano.
+c.ServerApp.kernel_manager_class = 'hotpot_km.PooledMappingKernelManager'
+
+# c.PooledMappingKernelManager.kernel_pools = {"python3": 2}
+# [PT-BR] Quantos kernels manter de prontidão por kernelspec (trait `kernel_pools`
+# do hotpot_km). Dois kernels python3 cobrem o caso comum (um notebook aberto +
+# um de reserva) sem reter muita RAM.
+c.PooledMappingKernelManager.kernel_pools = {"python3": 2}
+
+# c.PooledMappingKernelManager.python_imports = [...]
+# [PT-BR] Módulos importados em cada kernel do pool assim que ele sobe, tirando o
+# custo de import do caminho crítico da primeira célula. A importação de
+# `pyspark`/`pyspark.sql` já carrega o grosso do código Python do Spark; a JVM em
+# si só sobe no primeiro `SparkSession.builder.getOrCreate()` do notebook
+# (aquecê-la aqui criaria um SparkContext — e os recursos do cluster que ele
+# reserva — para kernels que talvez nunca usem Spark).
+c.PooledMappingKernelManager.python_imports = [
+    "pyspark",
+    "pyspark.sql",
+    "numpy",
+    "pandas",
+]
 
 # c.MappingKernelManager.cull_idle_timeout = 0
 # [PT-BR] Timeout (em segundos) para desligar kernels ociosos. 0 desabilita o culling.
 # Se > 0, kernels sem atividade por este período serão desligados. Útil para economizar recursos.
-# Exemplo: 3600 (1 hora)
-# c.MappingKernelManager.cull_idle_timeout = 3600
+# Em um cluster Spark/Hadoop compartilhado, cada kernel abandonado mantém na RAM o heap
+# Python (numpy/pandas importados) e um SparkContext com sua JVM — habilitar o culling
+# é a principal medida para recuperar essa memória de sessões esquecidas.
+c.MappingKernelManager.cull_idle_timeout = 3600
 
 # c.MappingKernelManager.cull_interval = 300
 # [PT-BR] Intervalo (em segundos) para verificar kernels ociosos. Padrão 300 (5 minutos).
 # Relevante se cull_idle_timeout > 0.
-# c.MappingKernelManager.cull_interval = 300
+c.MappingKernelManager.cull_interval = 300
 
 # c.MappingKernelManager.cull_connected = False
 # [PT-BR] Se `True`, kernels ociosos com conexões ativas (ex: um notebook aberto no navegador)
 # também podem ser desligados. Padrão `False`.
-# c.MappingKernelManager.cull_connected = True
+# Mantido `False` para não encerrar notebooks que ainda estão abertos no navegador.
+c.MappingKernelManager.cull_connected = False
+
+# c.MappingKernelManager.cull_busy = False
+# [PT-BR] Se `True`, até kernels ocupados (executando código) podem ser desligados.
+# Mantido `False` para NUNCA matar um job Spark no meio de um stage — sessões PySpark
+# com um SparkContext de longa duração ficam "busy" durante todo o job.
+c.MappingKernelManager.cull_busy = False
+
+# c.ServerApp.shutdown_no_activity_timeout = 0
+# [PT-BR] Desliga o PRÓPRIO servidor Jupyter (não apenas kernels) após este período
+# (em segundos) sem kernels ativos nem atividade. 0 desabilita. Complementa o culling
+# acima em implantações efêmeras (contêiner/VM dedicado por usuário), onde o contêiner
+# inteiro pode ser encerrado após inatividade prolongada.
+# Neste cluster o JupyterLab roda junto aos serviços Hadoop/Spark no mesmo contêiner,
+# então o desligamento automático fica desabilitado por padrão. Exemplo: 14400 (4 horas)
+# c.ServerApp.shutdown_no_activity_timeout = 14400
+
+# --- Extensões do Servidor ---
+
+# c.ServerApp.jpserver_extensions = {}
+# [PT-BR] Quais extensões do servidor carregar. O Jupyter Server IMPORTA toda
+# extensão habilitada na inicialização, use ela ou não — pacotes pesados
+# (panel, nbgitpuller, jupyter-resource-usage...) custam segundos de import no
+# caminho crítico do boot. Enumeramos explicitamente o que o fluxo Spark/Hadoop
+# deste repositório realmente usa: o JupyterLab e os terminais (o overrides.json
+# configura a extensão de terminal do Lab). O nbclassic fica desabilitado — a
+# interface clássica não é usada aqui e seu import puxa a árvore do notebook
+# antigo. Se instalar novas extensões na imagem, meça o custo com
+# `time python -c 'import <pacote_da_extensao>'` antes de habilitá-las.
+c.ServerApp.jpserver_extensions = {
+    "jupyterlab": True,
+    "jupyter_server_terminals": True,
+    "nbclassic": False,
+}
 
 # --- Outras Configurações ---
 
@@ -163,6 +270,23 @@ c.ServerApp.terminals_enabled = True
 # Relevante para requisições cross-origin com credenciais.
 # c.ServerApp.allow_credentials = True
 
+# c.ServerApp.iopub_data_rate_limit = 1000000 (padrão)
+# [PT-BR] Limite de bytes/segundo no canal IOPub (saída das células). Com o padrão,
+# saídas grandes de Spark — `df.show()` com muitas linhas, `toPandas()` exibido —
+# disparam o limitador, que represa e atrasa as mensagens (o usuário vê a célula
+# "travada" e o tornado segura os buffers na memória). Elevamos o limite para
+# tirar esse gargalo do canal de saída.
+c.ServerApp.iopub_data_rate_limit = 1.0e10
+
+# c.ServerApp.iopub_msg_rate_limit = 1000 (padrão)
+# [PT-BR] Limite de mensagens/segundo no IOPub. Elevado pelo mesmo motivo: barras
+# de progresso e prints em loop estouram o padrão com facilidade.
+c.ServerApp.iopub_msg_rate_limit = 10000
+
+# c.ServerApp.rate_limit_window = 3.0
+# [PT-BR] Janela (em segundos) usada para calcular as taxas acima.
+c.ServerApp.rate_limit_window = 3.0
+
 # c.ServerApp.log_level = 'INFO'
 # [PT-BR] Nível de log do servidor. Opções: 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'.
 c.ServerApp.log_level = 'INFO'
@@ -171,7 +295,13 @@ c.ServerApp.log_level = 'INFO'
 # [PT-BR] Se `True` (padrão), arquivos excluídos pela UI são movidos para uma lixeira
 # (no sistema de arquivos do servidor, dentro do diretório de dados do Jupyter)
 # em vez de serem permanentemente excluídos. Se `False`, a exclusão é permanente.
-c.FileContentsManager.delete_to_trash = True
+# Desabilitado aqui: a lixeira fica em ~/.local/share/Trash, que está em OUTRO
+# dispositivo em relação ao bind mount `./myfiles` do docker-compose (ou a um
+# `notebook_dir` montado via HDFS/FUSE). Nesse cenário o "mover para a lixeira"
+# vira copiar + apagar o arquivo inteiro — para as saídas parquet/CSV grandes que
+# o Spark deixa ao lado dos notebooks, isso transforma um delete O(1) em IO
+# proporcional ao tamanho do arquivo.
+c.FileContentsManager.delete_to_trash = False
 
 # --- Configurações que NÃO são mapeadas do seu overrides.json ---
 # A grande maioria das configurações no seu `overrides.json` são para o frontend do JupyterLab